@@ -4,36 +4,45 @@ Jedi.
 """
 
 
+def iter_parso_to_jedi_errors(grammar, module_node):
+    """Like :func:`parso_to_jedi_errors`, but wraps the errors lazily."""
+    return map(SyntaxError, grammar.iter_errors(module_node))
+
+
 def parso_to_jedi_errors(grammar, module_node):
-    return [SyntaxError(e) for e in grammar.iter_errors(module_node)]
+    return list(iter_parso_to_jedi_errors(grammar, module_node))
 
 
 class SyntaxError:
     """
     Syntax errors are generated by :meth:`.Script.get_syntax_errors`.
     """
+    __slots__ = ('_parso_error', '_start_pos', '_end_pos')
+
     def __init__(self, parso_error):
         self._parso_error = parso_error
+        self._start_pos = parso_error.start_pos
+        self._end_pos = parso_error.end_pos
 
     @property
     def line(self):
         """The line where the error starts (starting with 1)."""
-        return self._parso_error.start_pos[0]
+        return self._start_pos[0]
 
     @property
     def column(self):
         """The column where the error starts (starting with 0)."""
-        return self._parso_error.start_pos[1]
+        return self._start_pos[1]
 
     @property
     def until_line(self):
         """The line where the error ends (starting with 1)."""
-        return self._parso_error.end_pos[0]
+        return self._end_pos[0]
 
     @property
     def until_column(self):
         """The column where the error ends (starting with 0)."""
-        return self._parso_error.end_pos[1]
+        return self._end_pos[1]
 
     def get_message(self):
         return self._parso_error.message
@@ -41,6 +50,6 @@ class SyntaxError:
     def __repr__(self):
         return '<%s from=%s to=%s>' % (
             self.__class__.__name__,
-            self._parso_error.start_pos,
-            self._parso_error.end_pos,
+            self._start_pos,
+            self._end_pos,
         )
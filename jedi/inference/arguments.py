@@ -1,34 +1,45 @@
-import re
+from functools import partial
 from itertools import zip_longest
 
 from parso.python import tree
 
 from jedi import debug
-from jedi.inference.utils import PushBackIterator
 from jedi.inference import analysis
 from jedi.inference.lazy_value import LazyKnownValue, LazyKnownValues, \
     LazyTreeValue, get_merged_lazy_value
 from jedi.inference.names import ParamName, TreeNameDefinition, AnonymousParamName
 from jedi.inference.base_value import NO_VALUES, ValueSet, ContextualizedNode
 from jedi.inference.value import iterable
-from jedi.inference.cache import inference_state_as_method_param_cache
+from jedi.inference.cache import inference_state_as_method_param_cache, \
+    inference_state_function_cache
 
+_parsed_clinic_cache = {}
 
-def try_iter_content(types, depth=0):
+
+def try_iter_content(types, depth=0, _seen_depths=None):
     """Helper method for static analysis."""
     if depth > 10:
         # It's possible that a loop has references on itself (especially with
         # CompiledValue). Therefore don't loop infinitely.
         return
 
+    if _seen_depths is None:
+        _seen_depths = {}
     for typ in types:
+        # The same value is often reachable through different parents. It only
+        # needs to be iterated again if it is reached at a smaller depth,
+        # because then the depth limit cuts off less of its content.
+        seen_depth = _seen_depths.get(typ)
+        if seen_depth is not None and seen_depth <= depth:
+            continue
+        _seen_depths[typ] = depth
         try:
             f = typ.py__iter__
         except AttributeError:
             pass
         else:
             for lazy_value in f():
-                try_iter_content(lazy_value.infer(), depth + 1)
+                try_iter_content(lazy_value.infer(), depth + 1, _seen_depths)
 
 
 class ParamIssue(Exception):
@@ -46,50 +57,80 @@ def repack_with_argument_clinic(clinic_string):
         str.split.__text_signature__
         # Results in: '($self, /, sep=None, maxsplit=-1)'
     """
+    unpack_clinic = get_argument_clinic_unpacker(clinic_string)
+
     def decorator(func):
         def wrapper(value, arguments):
-            try:
-                args = tuple(iterate_argument_clinic(
-                    value.inference_state,
-                    arguments,
-                    clinic_string,
-                ))
-            except ParamIssue:
+            args = unpack_clinic(value.inference_state, arguments)
+            if args is None:
                 return NO_VALUES
-            else:
-                return func(value, *args)
+            return func(value, *args)
 
         return wrapper
     return decorator
 
 
 def iterate_argument_clinic(inference_state, arguments, clinic_string):
-    """Uses a list with argument clinic information (see PEP 436)."""
-    clinic_args = list(_parse_argument_clinic(clinic_string))
+    """
+    Uses a list with argument clinic information (see PEP 436). Raises
+    ``ParamIssue`` if the arguments don't match.
+    """
+    clinic_args = _parse_argument_clinic(clinic_string)
+    values = _iterate_argument_clinic(inference_state, arguments, clinic_args)
+    if values is None:
+        raise ParamIssue
+    return values
+
+
+def get_argument_clinic_unpacker(clinic_string):
+    """
+    Parses an argument clinic string once and returns a function
+    ``unpack(inference_state, arguments)``. It returns a list with a value set
+    for every clinic argument or ``None`` if the arguments don't match, so the
+    decorators don't need to raise and catch ``ParamIssue``.
+    """
+    return partial(_iterate_argument_clinic,
+                   clinic_args=_parse_argument_clinic(clinic_string))
 
-    iterator = PushBackIterator(arguments.unpack())
+
+def _iterate_argument_clinic(inference_state, arguments, clinic_args):
+    """
+    Like :func:`iterate_argument_clinic`, but works on the already parsed
+    clinic arguments, so decorators only need to parse the string once.
+    Returns a list with a value set for every clinic argument or ``None`` if
+    the arguments don't match.
+    """
+    values = []
+    # Clinic signatures are short, so a tuple with an index is cheaper than an
+    # iterator that supports pushing back.
+    items = tuple(arguments.unpack())
+    length = len(items)
+    index = 0
     for i, (name, optional, allow_kwargs, stars) in enumerate(clinic_args):
         if stars == 1:
             lazy_values = []
-            for key, argument in iterator:
-                if key is not None:
-                    iterator.push_back((key, argument))
-                    break
-
-                lazy_values.append(argument)
-            yield ValueSet([iterable.FakeTuple(inference_state, lazy_values)])
-            lazy_values
+            while index < length and items[index][0] is None:
+                lazy_values.append(items[index][1])
+                index += 1
+            if lazy_values:
+                values.append(ValueSet([iterable.FakeTuple(inference_state, lazy_values)]))
+            else:
+                values.append(_get_empty_var_args(inference_state))
             continue
         elif stars == 2:
             raise NotImplementedError()
-        key, argument = next(iterator, (None, None))
+        if index < length:
+            key, argument = items[index]
+            index += 1
+        else:
+            key, argument = None, None
         if key is not None:
             debug.warning('Keyword arguments in argument clinic are currently not supported.')
-            raise ParamIssue
+            return None
         if argument is None and not optional:
             debug.warning('TypeError: %s expected at least %s arguments, got %s',
                           name, len(clinic_args), i)
-            raise ParamIssue
+            return None
 
         value_set = NO_VALUES if argument is None else argument.infer()
 
@@ -98,30 +139,69 @@ def iterate_argument_clinic(inference_state, arguments, clinic_string):
             # that's ok, maybe something is too hard to resolve, however,
             # we will not proceed with the type inference of that function.
             debug.warning('argument_clinic "%s" not resolvable.', name)
-            raise ParamIssue
-        yield value_set
+            return None
+        values.append(value_set)
+    return values
+
+
+@inference_state_function_cache()
+def _get_empty_var_args(inference_state):
+    # An empty *args tuple looks the same for every call, so share it.
+    return ValueSet([iterable.FakeTuple(inference_state, [])])
 
 
 def _parse_argument_clinic(string):
+    try:
+        return _parsed_clinic_cache[string]
+    except KeyError:
+        result = _parsed_clinic_cache[string] = tuple(_scan_argument_clinic(string))
+        return result
+
+
+def _scan_argument_clinic(string):
     allow_kwargs = False
     optional = False
-    while string:
+    length = len(string)
+    i = 0
+    while i < length:
         # Optional arguments have to begin with a bracket. And should always be
         # at the end of the arguments. This is therefore not a proper argument
         # clinic implementation. `range()` for exmple allows an optional start
         # value at the beginning.
-        match = re.match(r'(?:(?:(\[),? ?|, ?|)(\**\w+)|, ?/)\]*', string)
-        string = string[len(match.group(0)):]
-        if not match.group(2):  # A slash -> allow named arguments
-            allow_kwargs = True
-            continue
-        optional = optional or bool(match.group(1))
-        word = match.group(2)
-        stars = word.count('*')
-        word = word[stars:]
-        yield (word, optional, allow_kwargs, stars)
+        char = string[i]
+        if char == '[':
+            optional = True
+            i += 1
+            if string.startswith(',', i):
+                i += 1
+            if string.startswith(' ', i):
+                i += 1
+        elif char == ',':
+            i += 1
+            if string.startswith(' ', i):
+                i += 1
+            if string.startswith('/', i):  # A slash -> allow named arguments
+                allow_kwargs = True
+                i += 1
+                while string.startswith(']', i):
+                    i += 1
+                continue
+
+        start = i
+        while string.startswith('*', i):
+            i += 1
+        stars = i - start
+        name_start = i
+        while i < length and (string[i].isalnum() or string[i] == '_'):
+            i += 1
+        if i == name_start:
+            raise ValueError('Invalid argument clinic string: %r' % string)
+
+        yield (string[name_start:i], optional, allow_kwargs, stars)
         if stars:
             allow_kwargs = True
+        while string.startswith(']', i):
+            i += 1
 
 
 class _AbstractArgumentsMixin:
@@ -138,15 +218,7 @@ class AbstractArguments(_AbstractArgumentsMixin):
     trailer = None
 
 
-def unpack_arglist(arglist):
-    if arglist is None:
-        return
-
-    if arglist.type != 'arglist' and not (
-            arglist.type == 'argument' and arglist.children[0] in ('*', '**')):
-        yield 0, arglist
-        return
-
+def _unpack_arglist_children(arglist):
     iterator = iter(arglist.children)
     for child in iterator:
         if child == ',':
@@ -155,14 +227,74 @@ def unpack_arglist(arglist):
             c = next(iterator, None)
             assert c is not None
             yield len(child.value), c
-        elif child.type == 'argument' and \
-                child.children[0] in ('*', '**'):
-            assert len(child.children) == 2
-            yield len(child.children[0].value), child.children[1]
+        elif child.type == 'argument':
+            yield from _unpack_single_argument(child)
         else:
             yield 0, child
 
 
+def _unpack_single_argument(argument):
+    children = argument.children
+    first = children[0]
+    if first in ('*', '**'):
+        assert len(children) == 2
+        yield len(first.value), children[1]
+    else:
+        yield 0, argument
+
+
+_UNPACK_ARGLIST_DISPATCH = {
+    'arglist': _unpack_arglist_children,
+    'argument': _unpack_single_argument,
+}
+
+
+def unpack_arglist(arglist):
+    if arglist is None:
+        return
+
+    handler = _UNPACK_ARGLIST_DISPATCH.get(arglist.type)
+    if handler is None:
+        yield 0, arglist
+        return
+    yield from handler(arglist)
+
+
+@inference_state_function_cache()
+def _get_unpack_operations(inference_state, argument_node):
+    """
+    Splits an argument node into the operations ``TreeArguments.unpack`` has to
+    execute. The tree is immutable, so this only needs to happen once per node.
+
+    Returns a tuple ``(positional_ops, named_ops, last_star_name)``. The
+    operations are tagged tuples: ``('pos', node)``, ``('star', node)``,
+    ``('starstar', node)``, ``('gencomp', entry_node, sync_comp_for)`` and
+    ``('kw', name, node)``. ``last_star_name`` is the last ``*args`` or
+    ``**kwargs`` argument that is a plain name, or ``None``.
+    """
+    positional_ops = []
+    named_ops = []
+    last_star_name = None
+    for star_count, el in unpack_arglist(argument_node):
+        if star_count:
+            positional_ops.append(('star' if star_count == 1 else 'starstar', el))
+            if isinstance(el, tree.Name):
+                last_star_name = el
+        elif el.type == 'argument':
+            c = el.children
+            if len(c) == 3:  # Keyword argument.
+                named_ops.append(('kw', c[0].value, c[2]))
+            else:  # Generator comprehension.
+                # Include the brackets with the parent.
+                sync_comp_for = c[1]
+                if sync_comp_for.type == 'comp_for':
+                    sync_comp_for = sync_comp_for.children[1]
+                positional_ops.append(('gencomp', c[0], sync_comp_for))
+        else:
+            positional_ops.append(('pos', el))
+    return positional_ops, named_ops, last_star_name
+
+
 class TreeArguments(AbstractArguments):
     def __init__(self, inference_state, context, argument_node, trailer=None):
         """
@@ -175,89 +307,82 @@ class TreeArguments(AbstractArguments):
 
     @classmethod
     @inference_state_as_method_param_cache()
-    def create_cached(cls, *args, **kwargs):
-        return cls(*args, **kwargs)
+    def create_cached(cls, inference_state, context, argument_node, trailer=None):
+        # Callers should pass everything positionally, so the cache key is the
+        # same tuple for the same call and no keyword arguments have to be
+        # hashed.
+        return cls(inference_state, context, argument_node, trailer)
 
     def unpack(self, funcdef=None):
-        named_args = []
-        for star_count, el in unpack_arglist(self.argument_node):
-            if star_count == 1:
-                arrays = self.context.infer_node(el)
-                iterators = [_iterate_star_args(self.context, a, el, funcdef)
+        positional_ops, named_ops, _ = _get_unpack_operations(
+            self._inference_state, self.argument_node)
+        context = self.context
+        for op in positional_ops:
+            kind = op[0]
+            if kind == 'pos':
+                yield None, LazyTreeValue(context, op[1])
+            elif kind == 'star':
+                el = op[1]
+                arrays = context.infer_node(el)
+                iterators = [_iterate_star_args(context, a, el, funcdef)
                              for a in arrays]
-                for values in list(zip_longest(*iterators)):
+                if len(iterators) == 1:
+                    # The common case of a single array needs no merging.
+                    for lazy_value in iterators[0]:
+                        yield None, lazy_value
+                    continue
+                for values in zip_longest(*iterators):
                     yield None, get_merged_lazy_value(
                         [v for v in values if v is not None]
                     )
-            elif star_count == 2:
-                arrays = self.context.infer_node(el)
+            elif kind == 'starstar':
+                el = op[1]
+                arrays = context.infer_node(el)
                 for dct in arrays:
-                    yield from _star_star_dict(self.context, dct, el, funcdef)
-            else:
-                if el.type == 'argument':
-                    c = el.children
-                    if len(c) == 3:  # Keyword argument.
-                        named_args.append((c[0].value, LazyTreeValue(self.context, c[2]),))
-                    else:  # Generator comprehension.
-                        # Include the brackets with the parent.
-                        sync_comp_for = el.children[1]
-                        if sync_comp_for.type == 'comp_for':
-                            sync_comp_for = sync_comp_for.children[1]
-                        comp = iterable.GeneratorComprehension(
-                            self._inference_state,
-                            defining_context=self.context,
-                            sync_comp_for_node=sync_comp_for,
-                            entry_node=el.children[0],
-                        )
-                        yield None, LazyKnownValue(comp)
-                else:
-                    yield None, LazyTreeValue(self.context, el)
+                    yield from _star_star_dict(context, dct, el, funcdef)
+            else:  # Generator comprehension.
+                comp = iterable.GeneratorComprehension(
+                    self._inference_state,
+                    defining_context=context,
+                    sync_comp_for_node=op[2],
+                    entry_node=op[1],
+                )
+                yield None, LazyKnownValue(comp)
 
         # Reordering arguments is necessary, because star args sometimes appear
         # after named argument, but in the actual order it's prepended.
-        yield from named_args
-
-    def _as_tree_tuple_objects(self):
-        for star_count, argument in unpack_arglist(self.argument_node):
-            default = None
-            if argument.type == 'argument':
-                if len(argument.children) == 3:  # Keyword argument.
-                    argument, default = argument.children[::2]
-            yield argument, default, star_count
-
-    def iter_calling_names_with_star(self):
-        for name, default, star_count in self._as_tree_tuple_objects():
-            # TODO this function is a bit strange. probably refactor?
-            if not star_count or not isinstance(name, tree.Name):
-                continue
+        for _, name, node in named_ops:
+            yield name, LazyTreeValue(context, node)
 
-            yield TreeNameDefinition(self.context, name)
+    def _get_last_star_name(self):
+        return _get_unpack_operations(self._inference_state, self.argument_node)[2]
 
     def __repr__(self):
         return '<%s: %s>' % (self.__class__.__name__, self.argument_node)
 
     def get_calling_nodes(self):
-        old_arguments_list = []
+        seen_arguments = set()
         arguments = self
 
-        while arguments not in old_arguments_list:
+        while arguments not in seen_arguments:
             if not isinstance(arguments, TreeArguments):
                 break
 
-            old_arguments_list.append(arguments)
-            for calling_name in reversed(list(arguments.iter_calling_names_with_star())):
-                names = calling_name.goto()
-                if len(names) != 1:
-                    break
-                if isinstance(names[0], AnonymousParamName):
-                    # Dynamic parameters should not have calling nodes, because
-                    # they are dynamic and extremely random.
-                    return []
-                if not isinstance(names[0], ParamName):
-                    break
-                executed_param_name = names[0].get_executed_param_name()
-                arguments = executed_param_name.arguments
+            seen_arguments.add(arguments)
+            star_name = arguments._get_last_star_name()
+            if star_name is None:
+                break
+            names = TreeNameDefinition(arguments.context, star_name).goto()
+            if len(names) != 1:
                 break
+            if isinstance(names[0], AnonymousParamName):
+                # Dynamic parameters should not have calling nodes, because
+                # they are dynamic and extremely random.
+                return []
+            if not isinstance(names[0], ParamName):
+                break
+            executed_param_name = names[0].get_executed_param_name()
+            arguments = executed_param_name.arguments
 
         if arguments.argument_node is not None:
             return [ContextualizedNode(arguments.context, arguments.argument_node)]
@@ -269,10 +394,15 @@ class TreeArguments(AbstractArguments):
 class ValuesArguments(AbstractArguments):
     def __init__(self, values_list):
         self._values_list = values_list
+        self._unpacked = None
 
     def unpack(self, funcdef=None):
-        for values in self._values_list:
-            yield None, LazyKnownValues(values)
+        # The lazy values only wrap the known value sets, so they can be
+        # reused for every unpack.
+        if self._unpacked is None:
+            self._unpacked = [(None, LazyKnownValues(values))
+                              for values in self._values_list]
+        yield from self._unpacked
 
     def __repr__(self):
         return '<%s: %s>' % (self.__class__.__name__, self._values_list)
@@ -305,31 +435,44 @@ class TreeArgumentsWrapper(_AbstractArgumentsMixin):
 
 
 def _iterate_star_args(context, array, input_node, funcdef=None):
-    if not array.py__getattribute__('__iter__'):
-        if funcdef is not None:
-            # TODO this funcdef should not be needed.
-            m = "TypeError: %s() argument after * must be a sequence, not %s" \
-                % (funcdef.name.value, array)
-            analysis.add(context, 'type-error-star', input_node, message=m)
-    try:
-        iter_ = array.py__iter__
-    except AttributeError:
-        pass
-    else:
+    # Looking up __iter__ means inferring a name, so only do it if the result
+    # is actually reported.
+    # TODO this funcdef should not be needed.
+    if funcdef is not None and not array.py__getattribute__('__iter__'):
+        m = "TypeError: %s() argument after * must be a sequence, not %s" \
+            % (funcdef.name.value, array)
+        analysis.add(context, 'type-error-star', input_node, message=m)
+    iter_ = getattr(array, 'py__iter__', None)
+    if iter_ is not None:
         yield from iter_()
 
 
+_compiled_instance_cls = None
+
+
+def _get_compiled_instance_cls():
+    # jedi.inference.value.instance imports this module, so it cannot be
+    # imported at the top. Cache it after the first call instead.
+    global _compiled_instance_cls
+    if _compiled_instance_cls is None:
+        from jedi.inference.value.instance import CompiledInstance
+        _compiled_instance_cls = CompiledInstance
+    return _compiled_instance_cls
+
+
 def _star_star_dict(context, array, input_node, funcdef):
-    from jedi.inference.value.instance import CompiledInstance
-    if isinstance(array, CompiledInstance) and array.name.string_name == 'dict':
+    # The result is only iterated, so an empty tuple is enough for the cases
+    # without keys.
+    if isinstance(array, iterable.Sequence) and array.array_type == 'dict':
+        return array.exact_key_items()
+    elif isinstance(array, _get_compiled_instance_cls()) \
+            and array.name.string_name == 'dict':
         # For now ignore this case. In the future add proper iterators and just
         # make one call without crazy isinstance checks.
-        return {}
-    elif isinstance(array, iterable.Sequence) and array.array_type == 'dict':
-        return array.exact_key_items()
+        return ()
     else:
         if funcdef is not None:
             m = "TypeError: %s argument after ** must be a mapping, not %s" \
                 % (funcdef.name.value, array)
             analysis.add(context, 'type-error-star-star', input_node, message=m)
-        return {}
+        return ()
@@ -46,9 +46,9 @@ def _iter_nodes_for_param(param_name):
 
                         args = TreeArguments.create_cached(
                             execution_context.inference_state,
-                            context=context,
-                            argument_node=trailer.children[1],
-                            trailer=trailer,
+                            context,
+                            trailer.children[1],
+                            trailer,
                         )
                         for c in values:
                             yield c, args
@@ -16,7 +16,7 @@ from inspect import Parameter
 from jedi import debug
 from jedi.inference.utils import safe_property
 from jedi.inference.helpers import get_str_or_none
-from jedi.inference.arguments import iterate_argument_clinic, ParamIssue, \
+from jedi.inference.arguments import get_argument_clinic_unpacker, \
     repack_with_argument_clinic, AbstractArguments, TreeArgumentsWrapper
 from jedi.inference import analysis
 from jedi.inference import compiled
@@ -151,13 +151,12 @@ def argument_clinic(clinic_string, want_value=False, want_context=False,
     """
     Works like Argument Clinic (PEP 436), to validate function params.
     """
+    unpack_clinic = get_argument_clinic_unpacker(clinic_string)
 
     def f(func):
         def wrapper(value, arguments, callback):
-            try:
-                args = tuple(iterate_argument_clinic(
-                    value.inference_state, arguments, clinic_string))
-            except ParamIssue:
+            args = unpack_clinic(value.inference_state, arguments)
+            if args is None:
                 return NO_VALUES
 
             debug.dbg('builtin start %s' % value, color='MAGENTA')
@@ -8,6 +8,8 @@ from textwrap import dedent
 
 import pytest
 
+from jedi.api.errors import iter_parso_to_jedi_errors
+
 
 @pytest.mark.parametrize(
     'code, line, column, until_line, until_column, message', [
@@ -53,3 +55,18 @@ def test_multi_syntax_error(Script):
     assert y.column == 7
     assert power.line == 5
     assert power.column == 4
+
+
+def test_iter_parso_to_jedi_errors(Script):
+    script = Script('def x():\n1\n1 *** 3\n')
+    iterator = iter_parso_to_jedi_errors(
+        script._inference_state.grammar, script._module_node)
+    assert iter(iterator) is iterator
+
+    def positions(errors):
+        return [(e.line, e.column, e.until_line, e.until_column, e.get_message())
+                for e in errors]
+
+    expected = positions(script.get_syntax_errors())
+    assert len(expected) == 2
+    assert positions(iterator) == expected
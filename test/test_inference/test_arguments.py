@@ -0,0 +1,45 @@
+import parso
+import pytest
+
+from jedi.inference.arguments import _parse_argument_clinic, unpack_arglist
+
+
+@pytest.mark.parametrize(
+    'clinic_string, expected', [
+        ('seq', [('seq', False, False, 0)]),
+        ('func, /', [('func', False, False, 0)]),
+        ('type, object, /', [('type', False, False, 0), ('object', False, False, 0)]),
+        ('iterator[, default], /',
+         [('iterator', False, False, 0), ('default', True, False, 0)]),
+        ('[type[, value]], /', [('type', True, False, 0), ('value', True, False, 0)]),
+        ('*args, /', [('args', False, False, 1)]),
+        ('first, /, second', [('first', False, False, 0), ('second', False, True, 0)]),
+        ('a, *args, **kwargs',
+         [('a', False, False, 0), ('args', False, False, 1), ('kwargs', False, True, 2)]),
+    ]
+)
+def test_parse_argument_clinic(clinic_string, expected):
+    assert list(_parse_argument_clinic(clinic_string)) == expected
+
+
+def test_parse_argument_clinic_invalid():
+    with pytest.raises(ValueError):
+        _parse_argument_clinic('a, ?')
+
+
+@pytest.mark.parametrize(
+    'code, expected', [
+        ('f()', []),
+        ('f(a)', [(0, 'a')]),
+        ('f(*a)', [(1, 'a')]),
+        ('f(**a)', [(2, 'a')]),
+        ('f(a, *b, c=1, **d)', [(0, 'a'), (1, 'b'), (0, 'c=1'), (2, 'd')]),
+        ('f(x for x in y)', [(0, 'x for x in y')]),
+    ]
+)
+def test_unpack_arglist(code, expected):
+    trailer = parso.parse(code).children[0].children[1]
+    arglist = trailer.children[1] if len(trailer.children) == 3 else None
+    result = [(stars, node.get_code().strip())
+              for stars, node in unpack_arglist(arglist)]
+    assert result == expected